@@ -1,135 +1,383 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
-import os
+import collections
+import importlib.util
 
+# explicit column types, so pandas can skip type inference when reading the csv file
+NASA_DTYPES = {'Name': 'int64', 'Absolute Magnitude': 'float64', 'Est Dia in KM(min)': 'float32',
+               'Est Dia in KM(max)': 'float32', 'Miss Dist.(kilometers)': 'float64', 'Miles per hour': 'float32',
+               'Minimum Orbit Intersection': 'float32', 'Orbit ID': 'int32', 'Hazardous': 'bool'}
+# columns that are not relevant for the analysis and are never read from the csv file
+DROPPED_COLUMNS = ['Orbiting Body', 'Neo Reference ID', 'Equinox']
+# columns needed by stream_reductions
+STREAM_COLUMNS = ['Name', 'Absolute Magnitude', 'Est Dia in KM(max)', 'Close Approach Date', 'Miss Dist.(kilometers)',
+                  'Orbit ID', 'Hazardous']
 
-def load_data(file_name):
+
+# arrays with fewer values than this are reduced with numpy, compiling with numba is only worth it for large arrays
+NUMBA_MIN_SIZE = 100_000
+# the numba compiled versions of the loops below, filled on first use by numba_kernel
+NUMBA_KERNELS = {}
+
+
+def numba_kernel(loop):
     '''
-    The function gets a file of csv type and returns a Data Frame of pandas.
-    :param file_name : a file of type csv
-    :return: pandas.DataFrame : pandas version of the csv file
+    Returns the given loop function compiled by numba (compiled on the first call and cached on disk),
+    or None if numba isn't installed.
+    numba is imported here and not at the top of the module, since importing it is slow (and also loads scipy).
+    :param loop: function – one of the *_loop functions below
+    :return: the compiled function, or None
+    '''
+    if loop not in NUMBA_KERNELS:
+        try:
+            import numba
+        except ImportError:
+            # numba is optional, without it the reductions run on plain numpy
+            NUMBA_KERNELS[loop] = None
+        else:
+            # (no fastmath: it assumes there are no NaNs, which must be skipped here)
+            NUMBA_KERNELS[loop] = numba.njit(cache=True)(loop)
+    return NUMBA_KERNELS[loop]
+
+
+def argmax_loop(values):
+    '''
+    Loop version of argmax_index, to be compiled by numba.
+    '''
+    i = -1
+    best = values[0]
+    for k in range(values.size):
+        value = values[k]
+        if value == value and (i == -1 or value > best):  # value == value is False only for NaN
+            best = value
+            i = k
+    return max(i, 0)
+
+
+def argmin_loop(values):
+    '''
+    Loop version of argmin_index, to be compiled by numba.
+    '''
+    i = -1
+    best = values[0]
+    for k in range(values.size):
+        value = values[k]
+        if value == value and (i == -1 or value < best):  # value == value is False only for NaN
+            best = value
+            i = k
+    return max(i, 0)
+
+
+def count_above_mean_loop(values):
+    '''
+    Loop version of count_above_mean, to be compiled by numba.
+    '''
+    total = 0.0  # accumulate in float64 for precision
+    num_values = 0
+    for value in values:
+        if value == value:  # False only for NaN
+            total += value
+            num_values += 1
+    if num_values == 0:
+        return 0
+    mean = total / num_values
+    count = 0
+    for value in values:
+        if value > mean:
+            count += 1
+    return count
+
+
+def argmax_index(values):
+    '''
+    Returns the position of the max value of a 1D numpy array (the first one if it appears more than once).
+    NaNs are skipped, if all the values are NaN the position is 0.
     '''
+    kernel = numba_kernel(argmax_loop) if values.size >= NUMBA_MIN_SIZE else None
+    if kernel is not None:
+        return kernel(values)
     try:
-        # check if file exists
-        if not os.path.isfile(file_name):
-            raise FileNotFoundError(f"File '{file_name}' does not exist.")
-        # check file extension (if csv)
-        if not file_name.lower().endswith('.csv'):
-            raise ValueError(f"File '{file_name}' is not a CSV file.")
+        return np.nanargmax(values)
+    except ValueError:  # all the values are NaN
+        return 0
 
-        df = pd.read_csv(file_name, sep=',')
 
-        if df.empty:
-            raise ValueError(f"File '{file_name}' is empty.")
+def argmin_index(values):
+    '''
+    Returns the position of the min value of a 1D numpy array (the first one if it appears more than once).
+    NaNs are skipped, if all the values are NaN the position is 0.
+    '''
+    kernel = numba_kernel(argmin_loop) if values.size >= NUMBA_MIN_SIZE else None
+    if kernel is not None:
+        return kernel(values)
+    try:
+        return np.nanargmin(values)
+    except ValueError:  # all the values are NaN
+        return 0
 
-        return df
-    # handle errors
-    except FileNotFoundError as err:
-        print(f"FileNotFoundError: {err}")
-    except ValueError as err:
-        print(f"Value Error : {err}")
-    except OSError:
-        print(f"OSError: Unable to open file \'{file_name}\'.")
-    except Exception as err:
-        print(f"An error occurred: {err}")
 
+def count_above_mean(values):
+    '''
+    Returns how many values of a 1D numpy array are greater than the mean of the array (0 for an empty array).
+    NaNs are skipped.
+    '''
+    kernel = numba_kernel(count_above_mean_loop) if values.size >= NUMBA_MIN_SIZE else None
+    if kernel is not None:
+        return kernel(values)
+    valid = values[~np.isnan(values)]
+    if valid.size == 0:
+        return 0
+    # accumulate the mean in float64 for precision
+    return np.count_nonzero(valid > valid.mean(dtype=np.float64))
+
+
+def load_data(file_name):
+    '''
+    The function gets a file of csv type and returns a Data Frame of pandas.
+    :param file_name : a file of type csv
+    :return: pandas.DataFrame : pandas version of the csv file
+    :raises FileNotFoundError: if the file does not exist (raised by pandas)
+    :raises ValueError: if the file is not a csv file or is empty
+    '''
+    # check file extension (if csv)
+    if not file_name.lower().endswith('.csv'):
+        raise ValueError(f"File '{file_name}' is not a CSV file.")
 
-def mask_data(df):
+    # parse the approach date once at read time, so later filters work on datetime values
+    read_options = dict(sep=',', dtype=NASA_DTYPES, parse_dates=['Close Approach Date'], date_format='%Y-%m-%d')
+    try:
+        # skip the irrelevant columns so they are never allocated
+        if importlib.util.find_spec('pyarrow') is not None:
+            # the pyarrow engine parses the columns in parallel, but needs the columns to read as a list
+            header = pd.read_csv(file_name, sep=',', nrows=0).columns
+            columns = [column for column in header if column not in DROPPED_COLUMNS]
+            df = pd.read_csv(file_name, engine='pyarrow', usecols=columns, **read_options)
+        else:
+            # fall back to the default C engine if pyarrow isn't installed, it reads the file only once
+            df = pd.read_csv(file_name, engine='c', usecols=lambda column: column not in DROPPED_COLUMNS,
+                             **read_options)
+    except pd.errors.EmptyDataError as err:
+        raise ValueError(f"File '{file_name}' is empty.") from err
+
+    if df.empty:
+        raise ValueError(f"File '{file_name}' is empty.")
+
+    return df
+
+
+def mask_data(df, mask=None):
     '''
     Filters the given DataFrame to exclude asteroids with a close approach date before the year 2000.
     :param df : pandas.DataFrame -  DataFrame including the info on asteroids close to earth
+    :param mask: numpy.ndarray – optional, an already computed year_mask of df
     :return: pandas.DataFrame: A filtered DataFrame including only rows with a close approach date from 2000 and onward
     '''
-    # Keep rows where the year (first 4 characters of the date string) is >= '2000'
-    filtered_df = df[df['Close Approach Date'].str[:4] >= '2000'] # filter and keep only those beyond 2000s
-    return filtered_df
+    if mask is None:
+        # Keep rows where the year of the (already parsed) close approach date is >= 2000
+        mask = year_mask(df)
+    filtered_df = df[mask] # filter and keep only those beyond 2000s
+    # renumber the rows 0..n-1 (a RangeIndex), so the filtered frame looks like a freshly loaded one
+    return filtered_df.reset_index(drop=True)
 
 
-def data_details(df):
+def year_mask(df):
     '''
-    The function drops the columns: 'Orbiting Body', 'Neo Reference ID', and 'Equinox' and returns a tuple containing:
-    the number of rows (int), the number of columns after dropping (int), list of the remaining column names (list of str)
-    :param df: pandas.DataFrame – The input DataFrame containing asteroid data
-    :return: tuple = (num_rows, num_columns, list_of_updated_column_names)
+    Builds a boolean mask of the asteroids with a close approach date from the year 2000 and onward.
+    The mask can be computed once and passed to the analysis functions instead of filtering the whole DataFrame.
+    :param df : pandas.DataFrame -  DataFrame including the info on asteroids close to earth
+    :return: numpy.ndarray: boolean array, True for rows with a close approach date from 2000 and onward
     '''
-    df = df.drop(columns=['Orbiting Body','Neo Reference ID', 'Equinox']) # remove specific columns
-    # get the shape of the DataFrame (returns a tuple: (num_rows, num_columns))
-    df_info = list(df.shape)  # convert the shape tuple to a list, so we can append to it
+    return df['Close Approach Date'].dt.year.to_numpy() >= 2000
 
-    # append a list of the column names to the shape info
-    df_info.append(list(df.columns))  # now df_info = [num_rows, num_columns, [column names]]
 
-    # convert the list back to a tuple for final output
-    df_info = tuple(df_info)
+def column_values(df, column_name, mask=None):
+    '''
+    Returns the values of a single column as a numpy array, keeping only the rows selected by the mask (if given).
+    :param df: pandas.DataFrame – DataFrame containing asteroid data
+    :param column_name: str – name of the column
+    :param mask: numpy.ndarray – optional boolean mask of the rows to keep (see year_mask)
+    :return: numpy.ndarray – the column values
+    '''
+    values = df[column_name].to_numpy()
+    if mask is not None:
+        values = values[mask]  # boolean indexing of a single array, no DataFrame copy
+    return values
+
 
+def row_position(i, mask=None):
+    '''
+    Converts a position in the masked column values (see column_values) to the row position in the DataFrame.
+    :param i: int – position in the masked column values
+    :param mask: numpy.ndarray – the boolean mask the column values were selected with (None if not masked)
+    :return: int – row position in the DataFrame
+    '''
+    return i if mask is None else np.flatnonzero(mask)[i]
+
+
+def data_details(df):
+    '''
+    The function returns a tuple containing: the number of rows (int), the number of columns (int),
+    list of the column names (list of str).
+    The columns: 'Orbiting Body', 'Neo Reference ID', and 'Equinox' are already skipped by load_data.
+    :param df: pandas.DataFrame – The input DataFrame containing asteroid data
+    :return: tuple = (num_rows, num_columns, list_of_column_names)
+    '''
     # return a tuple: (number of rows, number of columns, list of column names)
-    return df_info
+    return df.shape[0], df.shape[1], df.columns.tolist()
 
 
-def max_absolute_magnitude(df):
+def max_absolute_magnitude(df, mask=None):
     '''
     The function finds the asteroid with the highest absolute magnitude.
 
     :param df: pandas.DataFrame – DataFrame containing asteroid data
+    :param mask: numpy.ndarray – optional boolean mask of the rows to consider (see year_mask)
     :return: tuple – (asteroid_name: int, absolute_magnitude: float)
     '''
-    # sort by 'Absolute Magnitude' descending
-    temp_df = df.sort_values(by='Absolute Magnitude', ascending=False)
+    magnitudes = column_values(df, 'Absolute Magnitude', mask)
+
+    # find the position of the max 'Absolute Magnitude' (a single pass, no sorting of the whole frame)
+    i = argmax_index(magnitudes)
 
-    # get the values from the first row(max) and convert to Python types
-    abs_magnitude = float(temp_df.iat[0, df.columns.get_loc('Absolute Magnitude')])
-    asteroid_name = int(temp_df.iat[0, df.columns.get_loc('Name')])
+    # get the values from the max row and convert to Python types
+    abs_magnitude = float(magnitudes[i])
+    asteroid_name = int(df['Name'].to_numpy()[row_position(i, mask)])  # no masked copy of 'Name' needed
 
     # return a tuple
     return asteroid_name, abs_magnitude
 
 
-def closest_to_earth(df):
+def closest_to_earth(df, mask=None):
     '''
     The function finds and returns the name of the asteroid that came closest to Earth,
     based on the 'Miss Dist.(kilometers)' column.
     :param df: pandas.DataFrame – DataFrame containing asteroid data
+    :param mask: numpy.ndarray – optional boolean mask of the rows to consider (see year_mask)
     :return: int – asteroid name as an integer
     '''
-    # sort by miss distance (closest first)
-    temp_df = df.sort_values(by='Miss Dist.(kilometers)', ascending=True)
+    # find the position of the min miss distance (closest)
+    i = argmin_index(column_values(df, 'Miss Dist.(kilometers)', mask))
 
     # get the name/ID of the closest asteroid
-    asteroid_name = int(temp_df.iat[0, df.columns.get_loc('Name')])
+    asteroid_name = int(df['Name'].to_numpy()[row_position(i, mask)])  # no masked copy of 'Name' needed
 
     return asteroid_name
 
-def common_orbit(df):
+def common_orbit(df, mask=None):
     '''
     The function counts how many times each Orbit ID appears in the DataFrame
     and returns a dictionary with Orbit ID as keys and counts as integer values.
 
     :param df: pandas.DataFrame – DataFrame containing asteroid data
+    :param mask: numpy.ndarray – optional boolean mask of the rows to consider (see year_mask)
     :return: dict – {orbit_id: count}
     '''
-    # convert each counter to integer from numpy and create a dict with Orbit ID as keys, counts as values
-    return {name: int(count) for name, count in df['Orbit ID'].value_counts().items()}
-
-def min_max_diameter(df):
+    orbit_ids = column_values(df, 'Orbit ID', mask)
+    if orbit_ids.size and orbit_ids.min() >= 0 and orbit_ids.max() < 1_000_000:
+        # Orbit IDs are small non-negative integers, count them by position (no hashing)
+        counts = np.bincount(orbit_ids)
+        ids = np.flatnonzero(counts)  # keep only the Orbit IDs that appear
+        counts = counts[ids]
+    else:
+        # sort based counting for any other range of Orbit IDs
+        ids, counts = np.unique(orbit_ids, return_counts=True)
+    # tolist() converts the numpy values to Python ints in one go, create a dict with Orbit ID as keys, counts as values
+    return dict(zip(ids.tolist(), counts.tolist()))
+
+def min_max_diameter(df, mask=None):
     '''
     The function calculates and returns the number of asteroids whose maximum estimated diameter
     is greater than the average maximum diameter of all asteroids in the DataFrame.
 
     :param df: pandas.DataFrame – DataFrame containing asteroid data
+    :param mask: numpy.ndarray – optional boolean mask of the rows to consider (see year_mask)
     :return: int – number of asteroids with max diameter above average
     '''
-    # calculate the mean of max asteroid diameter
-    avg_diameter = df['Est Dia in KM(max)'].mean()
+    # work on the raw numpy buffer of the column
+    max_diameter = column_values(df, 'Est Dia in KM(max)', mask)
 
     # count the amount of asteroids above the average max diameter
-    count = (df['Est Dia in KM(max)'] > avg_diameter).sum()
+    count = count_above_mean(max_diameter)
 
     # return int count
     return int(count)
 
 
+def stream_reductions(file_name, chunksize=1_000_000):
+    '''
+    The function computes the results of max_absolute_magnitude, closest_to_earth, common_orbit and min_max_diameter
+    (and the number of hazardous asteroids) for the asteroids from the year 2000 and onward, reading the csv file
+    in chunks, so only one chunk is kept in memory at a time.
+    :param file_name : a file of type csv
+    :param chunksize: int – number of rows read at a time
+    :return: dict – {'max_absolute_magnitude': (asteroid_name, absolute_magnitude), 'closest_to_earth': asteroid_name,
+                     'common_orbit': {orbit_id: count}, 'min_max_diameter': count, 'hazardous': count}
+    :raises FileNotFoundError: if the file does not exist (raised by pandas)
+    :raises ValueError: if the file is not a csv file or is empty
+    '''
+    # check file extension (if csv), the same way as load_data
+    if not file_name.lower().endswith('.csv'):
+        raise ValueError(f"File '{file_name}' is not a CSV file.")
+
+    read_options = dict(sep=',', chunksize=chunksize, usecols=STREAM_COLUMNS,
+                        dtype={column: NASA_DTYPES[column] for column in STREAM_COLUMNS if column in NASA_DTYPES},
+                        parse_dates=['Close Approach Date'], date_format='%Y-%m-%d')
+
+    max_name, max_magnitude = None, -np.inf
+    closest_name, min_distance = None, np.inf
+    orbit_counts = collections.Counter()
+    total_diameter = 0.0
+    num_asteroids = 0
+    num_hazardous = 0
+    num_rows = 0
+
+    try:
+        chunks = pd.read_csv(file_name, **read_options)
+    except pd.errors.EmptyDataError as err:
+        raise ValueError(f"File '{file_name}' is empty.") from err
+
+    # first pass: reductions that can be combined chunk by chunk
+    for chunk in chunks:
+        num_rows += len(chunk)
+        if chunk.empty:  # (the date column of an empty chunk is not parsed as datetime)
+            continue
+        chunk = mask_data(chunk)
+        if chunk.empty:
+            continue
+        name, magnitude = max_absolute_magnitude(chunk)
+        if magnitude > max_magnitude:  # strict, so the first asteroid in the file wins on ties
+            max_name, max_magnitude = name, magnitude
+        distances = column_values(chunk, 'Miss Dist.(kilometers)')
+        i = argmin_index(distances)
+        if distances[i] < min_distance:
+            closest_name, min_distance = int(column_values(chunk, 'Name')[i]), distances[i]
+        orbit_counts.update(common_orbit(chunk))
+        max_diameter = column_values(chunk, 'Est Dia in KM(max)')
+        total_diameter += np.nansum(max_diameter, dtype=np.float64)  # missing values are skipped, as in count_above_mean
+        num_asteroids += np.count_nonzero(~np.isnan(max_diameter))
+        num_hazardous += int(chunk['Hazardous'].to_numpy(dtype=bool).view(np.uint8).sum())
+
+    if num_rows == 0:
+        raise ValueError(f"File '{file_name}' is empty.")
+
+    # second pass: count the asteroids above the average max diameter, which is known only after the first pass
+    num_above_average = 0
+    if num_asteroids:
+        avg_diameter = total_diameter / num_asteroids
+        # only the two columns needed here are parsed again
+        diameter_options = dict(read_options, usecols=['Close Approach Date', 'Est Dia in KM(max)'],
+                                dtype={'Est Dia in KM(max)': NASA_DTYPES['Est Dia in KM(max)']})
+        for chunk in pd.read_csv(file_name, **diameter_options):
+            max_diameter = column_values(chunk, 'Est Dia in KM(max)', year_mask(chunk))
+            num_above_average += np.count_nonzero(max_diameter > avg_diameter)
+
+    return {'max_absolute_magnitude': (max_name, max_magnitude) if max_name is not None else None,
+            'closest_to_earth': closest_name,
+            'common_orbit': dict(orbit_counts),
+            'min_max_diameter': int(num_above_average),
+            'hazardous': num_hazardous}
+
+
 def plt_hist_diameter(df):
     '''
     The function calculates the average estimated diameter of each asteroid based on the minimum and maximum
@@ -138,11 +386,20 @@ def plt_hist_diameter(df):
     :param df:  pandas.DataFrame – DataFrame containing asteroid data
     :return: None – displays a matplotlib histogram
     '''
-    # calculating the average diameter size
-    df['Est Dia in KM(avg)'] = (df['Est Dia in KM(min)'] + df['Est Dia in KM(max)']) / 2
-
-    # building histogram
-    plt.hist(df['Est Dia in KM(avg)'], bins=100, color='#990f02', edgecolor='black')
+    import matplotlib.pyplot as plt  # imported only when plotting
+
+    # calculating the average diameter size (a local array, the given DataFrame is not modified)
+    # (float32 views of the columns, no copy since they are read as float32, see NASA_DTYPES)
+    min_diameter = df['Est Dia in KM(min)'].to_numpy(dtype=np.float32, copy=False)
+    max_diameter = df['Est Dia in KM(max)'].to_numpy(dtype=np.float32, copy=False)
+    avg_diameter = np.empty_like(min_diameter)  # the only allocation
+    np.add(min_diameter, max_diameter, out=avg_diameter)
+    avg_diameter *= 0.5
+
+    # building histogram (bins are counted by numpy, matplotlib only draws the bars)
+    avg_diameter = avg_diameter[~np.isnan(avg_diameter)]  # skip missing values, as plt.hist does
+    counts, edges = np.histogram(avg_diameter, bins=100)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='#990f02', edgecolor='black')
     # histogram title
     plt.title('Distribution of Average diameter size', fontsize=14)
     # labels for the axes
@@ -162,11 +419,13 @@ def plt_hist_common_orbit(df):
     :param df: pandas.DataFrame – DataFrame containing asteroid data
     :return: None – displays a matplotlib histogram
     '''
+    import matplotlib.pyplot as plt  # imported only when plotting
 
-    # Sort descending
-    temp_df = df.sort_values(by='Minimum Orbit Intersection', ascending=False)
-    # building histogram
-    plt.hist(temp_df['Minimum Orbit Intersection'], bins=10, color='#990f02', edgecolor='black')
+    # building histogram (bins are counted by numpy, matplotlib only draws the bars)
+    orbit_intersection = df['Minimum Orbit Intersection'].to_numpy()
+    orbit_intersection = orbit_intersection[~np.isnan(orbit_intersection)]  # skip missing values, as plt.hist does
+    counts, edges = np.histogram(orbit_intersection, bins=10)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='#990f02', edgecolor='black')
 
     # histogram title
     plt.title('Distribution of Asteroids by Minimum Orbit Intersection', fontsize=14)
@@ -187,9 +446,13 @@ def plt_pie_hazard(df):
     :param df: pandas.DataFrame –  DataFrame containing asteroid data
     :return: None – displays a matplotlib pie chart
     '''
+    import matplotlib.pyplot as plt  # imported only when plotting
+
     pie_labels = ['True', 'False']
-    count_true = (df['Hazardous'] == True).sum()  # sum the amount of hazardous asteroids
-    count_false = (df['Hazardous'] == False).sum()  # sum the amount of non-hazardous asteroids
+    # view 'Hazardous' as 1-byte integers for a vectorized sum (no copy when it is read as bool, see NASA_DTYPES)
+    hazardous = df['Hazardous'].to_numpy(dtype=bool).view(np.uint8)
+    count_true = int(hazardous.sum())  # sum the amount of hazardous asteroids
+    count_false = hazardous.size - count_true  # the rest are non-hazardous asteroids
     items = [count_true, count_false]  # create a list of those values
     explode = (0, 0.1)  # only "explode" the 2nd slice (part of pie chart design)
     plt.pie(items, labels=pie_labels, explode=explode, colors=['#990f02', '#d4a017'], autopct='%1.1f%%')  # create pie chart
@@ -209,13 +472,33 @@ def plt_linear_motion_magnitude(df):
     :param df: pandas.DataFrame – DataFrame containing asteroid data
     :return: None – displays a scatter plot with regression line if significant
     '''
-    # linear regression evaluation
-    x = df['Miss Dist.(kilometers)']
-    y = df['Miles per hour']
-    a, b, r_value, p_value, std_err = stats.linregress(x, y)
+    import matplotlib.pyplot as plt  # imported only when plotting
+    from scipy import stats
+
+    # linear regression evaluation (closed-form least squares, only the slope, intercept and p-value are needed)
+    x = df['Miss Dist.(kilometers)'].to_numpy(np.float64)
+    y = df['Miles per hour'].to_numpy(np.float64)
+    n = x.size
+    x_mean = x.mean()
+    y_mean = y.mean()
+    x_centered = x - x_mean  # centering keeps the sums numerically stable for large distances
+    y_centered = y - y_mean
+    sxx = np.dot(x_centered, x_centered)
+    syy = np.dot(y_centered, y_centered)
+    sxy = np.dot(x_centered, y_centered)
+    a = sxy / sxx  # slope
+    b = y_mean - a * x_mean  # intercept
+    # two-sided p-value of the t-test for a non-zero slope
+    r_value = sxy / np.sqrt(sxx * syy)
+    t_value = r_value * np.sqrt((n - 2) / max(1.0 - r_value ** 2, np.finfo(np.float64).tiny))
+    p_value = 2 * stats.t.sf(abs(t_value), n - 2)
     if p_value < 0.05:
-        plt.scatter(x, y, label="Data points")
-        plt.plot(x, a*x + b, label="Regression line", color="red")
+        # draw (at most ~5000) data points as a single line artist with pixel markers
+        stride = max(1, -(-n // 5000))  # ceiling division, so at most 5000 points are drawn
+        plt.plot(x[::stride], y[::stride], ',', label="Data points")
+        # the regression line only needs its two end points
+        x_ends = np.array([x.min(), x.max()])
+        plt.plot(x_ends, a*x_ends + b, label="Regression line", color="red")
 
         plt.legend()  # add built-in label explaining the components of the histogram
         plt.grid()  # add grid to the plot
@@ -226,16 +509,19 @@ def plt_linear_motion_magnitude(df):
         # display the histogram
         plt.show()
 
-# Tester
-df = load_data('nasa.csv')
-print(df)
-df = mask_data(df)
-print(df)
-print(max_absolute_magnitude(df))
-print(closest_to_earth(df))
-print(common_orbit(df))
-print(min_max_diameter(df))
-plt_hist_diameter(df)
-plt_hist_common_orbit(df)
-plt_pie_hazard(df)
-plt_linear_motion_magnitude(df)
\ No newline at end of file
+
+# Tester (runs only when the file is executed as a script)
+if __name__ == '__main__':
+    df = load_data('nasa.csv')
+    print(df)
+    mask = year_mask(df)  # computed once, reused by the filter and the analysis functions
+    filtered_df = mask_data(df, mask)
+    print(filtered_df)
+    print(max_absolute_magnitude(df, mask))
+    print(closest_to_earth(df, mask))
+    print(common_orbit(df, mask))
+    print(min_max_diameter(df, mask))
+    plt_hist_diameter(filtered_df)
+    plt_hist_common_orbit(filtered_df)
+    plt_pie_hazard(filtered_df)
+    plt_linear_motion_magnitude(filtered_df)
\ No newline at end of file